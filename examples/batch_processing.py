@@ -204,16 +204,16 @@ def traditional_batch_processing(input_dir: str, output_dir: str) -> None:
     
     # 执行示例
     print("\n1. 批量调整图像大小")
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = batch_resize(max_width=600, max_height=400)
-    end_time = time.time()
+    end_time = time.perf_counter()
     print_batch_results(results)
     print(f"\n耗时: {end_time - start_time:.2f} 秒")
     
     print("\n2. 批量应用灰度滤镜")
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = batch_apply_filter("grayscale")
-    end_time = time.time()
+    end_time = time.perf_counter()
     print_batch_results(results)
     print(f"\n耗时: {end_time - start_time:.2f} 秒")
 
@@ -243,7 +243,7 @@ def parallel_batch_processing(input_dir: str, output_dir: str) -> None:
     # 示例1: 格式转换
     print("\n=== 示例1: 批量转换为WEBP格式 ===")
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = batch_processor.convert_format(
             image_paths=image_paths,
             output_format="WEBP",
@@ -252,7 +252,7 @@ def parallel_batch_processing(input_dir: str, output_dir: str) -> None:
             show_progress=True,
             skip_existing=True
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 处理结果
         success_count = sum(1 for result in results.values() if not isinstance(result, Exception))
@@ -268,7 +268,7 @@ def parallel_batch_processing(input_dir: str, output_dir: str) -> None:
     # 示例2: 调整大小
     print("\n=== 示例2: 批量调整大小 ===")
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = batch_processor.resize_images(
             image_paths=image_paths,
             width=800,
@@ -278,7 +278,7 @@ def parallel_batch_processing(input_dir: str, output_dir: str) -> None:
             show_progress=True,
             skip_existing=True
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         success_count = sum(1 for result in results.values() if not isinstance(result, Exception))
         failed_count = len(results) - success_count
@@ -293,7 +293,7 @@ def parallel_batch_processing(input_dir: str, output_dir: str) -> None:
     # 示例3: 添加水印
     print("\n=== 示例3: 批量添加水印 ===")
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = batch_processor.add_text_watermark_to_images(
             image_paths=image_paths,
             text="Gneiss-Engine",
@@ -304,7 +304,7 @@ def parallel_batch_processing(input_dir: str, output_dir: str) -> None:
             show_progress=True,
             skip_existing=True
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         success_count = sum(1 for result in results.values() if not isinstance(result, Exception))
         failed_count = len(results) - success_count
@@ -333,7 +333,7 @@ def parallel_batch_processing(input_dir: str, output_dir: str) -> None:
                 )
             )
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = batch_processor.process_images(
             image_paths=image_paths,
             operation=custom_operation,
@@ -343,7 +343,7 @@ def parallel_batch_processing(input_dir: str, output_dir: str) -> None:
             show_progress=True,
             skip_existing=True
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         success_count = sum(1 for result in results.values() if not isinstance(result, Exception))
         failed_count = len(results) - success_count
@@ -416,7 +416,7 @@ def batch_format_conversion(input_dir: str, output_dir: str) -> None:
     
     batch_processor = BatchProcessor()
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = batch_processor.convert_format(
             image_paths=image_paths,
             output_format=output_format,
@@ -425,7 +425,7 @@ def batch_format_conversion(input_dir: str, output_dir: str) -> None:
             show_progress=True,
             skip_existing=True
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         success_count = sum(1 for result in results.values() if not isinstance(result, Exception))
         
@@ -564,7 +564,7 @@ def custom_batch_workflow(input_dir: str, output_dir: str) -> None:
     print(f"\n开始执行工作流，处理 {len(image_paths)} 个文件...")
     
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = batch_processor.process_images(
             image_paths=image_paths,
             operation=workflow,
@@ -574,7 +574,7 @@ def custom_batch_workflow(input_dir: str, output_dir: str) -> None:
             show_progress=True,
             skip_existing=True
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         success_count = sum(1 for result in results.values() if not isinstance(result, Exception))
         
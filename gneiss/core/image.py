@@ -7,7 +7,7 @@ for all image manipulation operations in Gneiss-Engine.
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from PIL import Image as PILImage
 from PIL import ImageDraw, ImageEnhance, ImageFilter, ImageFont, ImageOps
@@ -429,28 +429,34 @@ class Image:
 
         return self
 
-    def save(self, path: Union[str, Path], **kwargs) -> "Image":
+    def save(self, path: Union[str, Path, BinaryIO], **kwargs) -> "Image":
         """
         Save the image to the specified path.
 
         Args:
-            path: The path where the image will be saved.
+            path: The path where the image will be saved, or a writable binary
+                file object such as ``io.BytesIO``.
             **kwargs: Additional parameters to pass to PIL's save method.
 
         Returns:
             The Image instance for method chaining.
         """
-        save_path = Path(path)
-
-        # Create directory if it doesn't exist
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Combine format-specific parameters with any additional parameters
         save_params = {}
         if hasattr(self, "format_params"):
             save_params.update(self.format_params)
         save_params.update(kwargs)
 
+        if hasattr(path, "write"):
+            # File objects are written in place and leave the path untouched
+            self.image.save(path, format=self.format, **save_params)
+            return self
+
+        save_path = Path(path)
+
+        # Create directory if it doesn't exist
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+
         # Save the image
         self.image.save(save_path, format=self.format, **save_params)
 
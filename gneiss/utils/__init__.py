@@ -7,14 +7,19 @@ This package contains utility functions for file operations and metadata handlin
 from gneiss.utils.file_utils import (
     apply_rename,
     batch_rename,
+    find_images,
+    find_images_grouped,
     generate_sequential_names,
     get_files_by_extension,
 )
 from gneiss.utils.metadata_utils import (
     copy_metadata,
     extract_exif,
+    extract_exif_batch,
     get_creation_date,
+    get_creation_dates_async,
     get_gps_coordinates,
+    get_gps_coordinates_async,
     get_image_metadata,
     strip_all_metadata,
 )
@@ -24,10 +29,15 @@ __all__ = [
     "batch_rename",
     "apply_rename",
     "generate_sequential_names",
+    "find_images",
+    "find_images_grouped",
     "extract_exif",
+    "extract_exif_batch",
     "get_image_metadata",
     "get_creation_date",
+    "get_creation_dates_async",
     "get_gps_coordinates",
+    "get_gps_coordinates_async",
     "strip_all_metadata",
     "copy_metadata",
 ]
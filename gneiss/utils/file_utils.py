@@ -11,8 +11,9 @@ import os
 import re
 import shutil
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple, Union
 
 
 def get_files_by_extension(
@@ -56,7 +57,7 @@ def get_files_by_extension(
 
 def batch_rename(
     files: List[Union[str, Path]],
-    pattern: str,
+    pattern: Union[str, Pattern[str]],
     replacement: str,
     use_regex: bool = False,
 ) -> Dict[str, str]:
@@ -65,7 +66,8 @@ def batch_rename(
 
     Args:
         files: List of file paths to rename.
-        pattern: The pattern to search for in the filename.
+        pattern: The pattern to search for in the filename. A pre-compiled
+            regular expression is always used as a regex.
         replacement: The replacement string.
         use_regex: Whether to use regex for pattern matching.
 
@@ -78,14 +80,17 @@ def batch_rename(
         {'img001.jpg': 'photo001.jpg', 'img002.jpg': 'photo002.jpg'}
     """
     result = {}
+    regex = None
+    if use_regex or isinstance(pattern, re.Pattern):
+        regex = re.compile(pattern)
 
     for file_path in files:
         file_path = Path(file_path)
         original_name = file_path.name
         parent_dir = file_path.parent
 
-        if use_regex:
-            new_name = re.sub(pattern, replacement, original_name)
+        if regex is not None:
+            new_name = regex.sub(replacement, original_name)
         else:
             new_name = original_name.replace(pattern, replacement)
 
@@ -161,8 +166,8 @@ def generate_sequential_names(
         extension = f".{extension}"
 
     # Get existing files to determine how many files to generate
-    existing_files = list(directory.iterdir())
-    file_count = len([f for f in existing_files if f.is_file()])
+    with os.scandir(directory) as entries:
+        file_count = sum(1 for entry in entries if entry.is_file())
 
     # Generate sequential names
     result = []
@@ -225,6 +230,28 @@ def find_images(directory: Union[str, Path],
     return image_paths
 
 
+def find_images_grouped(directory: Union[str, Path],
+                        extensions: Optional[List[str]] = None,
+                        recursive: bool = True) -> Dict[str, List[str]]:
+    """
+    在指定目录中查找图像文件，并在同一次遍历中按扩展名分组
+    
+    Args:
+        directory: 要搜索的目录路径
+        extensions: 要查找的文件扩展名列表，默认为常见图像格式
+        recursive: 是否递归搜索子目录
+        
+    Returns:
+        小写扩展名到已排序绝对路径列表的字典
+    """
+    groups: Dict[str, List[str]] = {}
+    for path in find_images(directory, extensions, recursive):
+        _, ext = os.path.splitext(path.lower())
+        groups.setdefault(ext, []).append(path)
+    
+    return groups
+
+
 def get_unique_filename(base_path: Union[str, Path], suffix: str = '') -> str:
     """
     生成唯一的文件名，避免覆盖现有文件
@@ -454,6 +481,59 @@ def move_files_with_progress(source_paths: List[str],
     return results
 
 
+# 超过该数量的文件交给线程池并行删除
+_PARALLEL_REMOVE_THRESHOLD = 32
+
+
+def _remove_file(file_path: str) -> bool:
+    """删除单个文件，返回是否成功"""
+    try:
+        os.unlink(file_path)
+        return True
+    except OSError:
+        return False
+
+
+def remove_files_with_progress(file_paths: List[str],
+                               on_progress=None,
+                               max_workers: int = 8) -> Dict[str, bool]:
+    """
+    删除文件列表中的所有文件，并支持进度回调
+
+    文件数量较多时使用线程池并行执行 unlink，减少逐个删除的等待时间。
+    
+    Args:
+        file_paths: 要删除的文件路径列表
+        on_progress: 进度回调函数，接收参数 (current, total)
+        max_workers: 并行删除时使用的最大线程数
+        
+    Returns:
+        文件路径到是否删除成功的映射
+    """
+    paths = [str(file_path) for file_path in file_paths]
+    total = len(paths)
+
+    if total > _PARALLEL_REMOVE_THRESHOLD and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(_remove_file, paths)
+            results = {}
+            for i, (file_path, removed) in enumerate(zip(paths, outcomes)):
+                results[file_path] = removed
+                if on_progress:
+                    on_progress(i + 1, total)
+        return results
+
+    results = {}
+    for i, file_path in enumerate(paths):
+        results[file_path] = _remove_file(file_path)
+
+        # 调用进度回调
+        if on_progress:
+            on_progress(i + 1, total)
+
+    return results
+
+
 def generate_output_filename(input_path: Union[str, Path], 
                             output_dir: Optional[Union[str, Path]] = None, 
                             output_format: Optional[str] = None,
@@ -5,49 +5,397 @@ This module provides functions for working with image metadata,
 including EXIF, IPTC, and XMP data.
 """
 
+import asyncio
+import logging
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-from PIL import Image
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from PIL import Image, IptcImagePlugin
 from PIL.ExifTags import GPSTAGS, TAGS
 
+try:
+    from libxmp import XMPFiles, XMPMeta
+except Exception:  # ImportError, or libxmp's ExempiLoadError without Exempi
+    XMPFiles = XMPMeta = None
+
+logger = logging.getLogger(__name__)
+
+# Metadata kinds each image format can carry; formats not listed are probed
+# for everything.
+_ALL_METADATA = frozenset(("exif", "iptc", "xmp"))
+_METADATA_CAPABILITIES = {
+    "JPEG": _ALL_METADATA,
+    "MPO": _ALL_METADATA,
+    "TIFF": _ALL_METADATA,
+    "PNG": frozenset(("exif", "xmp")),
+    "WEBP": frozenset(("exif", "xmp")),
+    "HEIF": frozenset(("exif", "xmp")),
+    "GIF": frozenset(("xmp",)),
+    "BMP": frozenset(),
+    "ICO": frozenset(),
+    "PPM": frozenset(),
+}
+
+# JPEG markers; EXIF lives in the APP1 segment right after SOI, so only the
+# first pages of a file have to be read to find it.
+_JPEG_SOI = b"\xff\xd8"
+_JPEG_SOS = 0xDA
+_JPEG_EOI = 0xD9
+_JPEG_APP0 = 0xE0
+_JPEG_APP1 = 0xE1
+_EXIF_HEADER = b"Exif\x00\x00"
+
+# APP1 (EXIF/XMP) through APP13 (IPTC) and COM carry metadata; APP0 (JFIF) and
+# APP14 (Adobe colour transform) affect decoding and are kept.
+_JPEG_METADATA_MARKERS = frozenset(range(0xE1, 0xEE)) | {0xFE}
+
+# XMP packets in JPEG APP1 segments and TIFF tags
+_XMP_HEADER = b"http://ns.adobe.com/xap/1.0/\x00"
+_TIFF_XMP_TAG = 700
+
+# EXIF tag IDs used by the lookups that skip the TAGS name translation
+_EXIF_IFD_TAG = 0x8769
+_GPSINFO_TAG = 0x8825
+_DATETIME_TAG = 0x0132
+_DATETIME_ORIGINAL_TAG = 0x9003
+_DATETIME_DIGITIZED_TAG = 0x9004
+_TAG_IDS = {name: tag_id for tag_id, name in TAGS.items()}
+
+# Degrees/minutes/seconds to decimal degrees
+_ARCMINUTE = 1 / 60
+_ARCSECOND = 1 / 3600
+_NEGATIVE_GPS_REFS = frozenset(("S", "W"))
+
+
+def _iter_jpeg_segments(
+    data: Union[bytes, mmap.mmap]
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Walk the marker segments of a JPEG stream without decoding it.
+
+    Args:
+        data: The JPEG bytes, or a memory map of the file.
+
+    Yields:
+        ``(marker, start, end)`` tuples where ``data[start:end]`` is the whole
+        segment including its marker. Iteration stops after the start of scan
+        (or end of image) marker, which is yielded with ``end == len(data)``,
+        or silently when the stream is malformed or truncated.
+    """
+    if data[: len(_JPEG_SOI)] != _JPEG_SOI:
+        return
+
+    pos = len(_JPEG_SOI)
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker in (_JPEG_SOS, _JPEG_EOI):
+            # Entropy-coded data follows, no more metadata segments
+            yield marker, pos, len(data)
+            return
+
+        (length,) = struct.unpack(">H", data[pos + 2 : pos + 4])
+        yield marker, pos, pos + 2 + length
+        pos += 2 + length
+
+
+def _read_jpeg_exif_segment(image_path: Union[str, Path]) -> Optional[bytes]:
+    """
+    Read the raw EXIF APP1 payload of a JPEG file without opening it with PIL.
+
+    The file is memory-mapped, so only the pages holding the segment headers
+    are paged in and nothing is copied until the payload itself is sliced out.
+
+    Args:
+        image_path: Path to the image file.
+
+    Returns:
+        The APP1 payload (including the ``Exif`` header), an empty bytes object if
+        the JPEG has no EXIF segment, or None if the file is not a JPEG or the
+        segment could not be located.
+    """
+    with open(image_path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return None
+
+        with data:
+            for marker, start, end in _iter_jpeg_segments(data):
+                if marker in (_JPEG_SOS, _JPEG_EOI):
+                    return b""
+                if (
+                    marker == _JPEG_APP1
+                    and data[start + 4 : start + 10] == _EXIF_HEADER
+                ):
+                    return data[start + 4 : end]
+
+    return None
+
+
+def _strip_jpeg_metadata(data: bytes) -> Optional[bytes]:
+    """
+    Remove metadata segments from a JPEG stream, leaving the scan data untouched.
+
+    Args:
+        data: The complete JPEG file contents.
+
+    Returns:
+        The JPEG bytes without metadata segments, or None if the stream could
+        not be parsed as a JPEG.
+    """
+    chunks = [_JPEG_SOI]
+
+    for marker, start, end in _iter_jpeg_segments(data):
+        if marker not in _JPEG_METADATA_MARKERS:
+            chunks.append(data[start:end])
+        if marker in (_JPEG_SOS, _JPEG_EOI):
+            return b"".join(chunks)
+
+    return None
+
+
+def _merge_exif(
+    exif: Image.Exif,
+    tags: Optional[Set[str]] = None,
+    stop_tag: Optional[str] = None,
+) -> Dict[int, Any]:
+    """
+    Flatten IFD0, the Exif sub-IFD and the GPS sub-IFD into a single dictionary.
+
+    Args:
+        exif: The loaded EXIF block.
+        tags: If given, the sub-IFDs that cannot contain any of these tags are
+              not parsed.
+        stop_tag: If given and found in IFD0, the tags after it are dropped and
+                  the Exif sub-IFD is not parsed.
+
+    Returns:
+        A dictionary keyed by numeric tag ID, with the GPS data nested as a
+        dictionary under the GPSInfo tag.
+    """
+    merged = dict(exif)
+
+    stop_id = _TAG_IDS.get(stop_tag) if stop_tag is not None else None
+    if stop_id in merged:
+        tag_ids = list(merged)
+        del tag_ids[tag_ids.index(stop_id) + 1 :]
+        merged = {tag_id: merged[tag_id] for tag_id in tag_ids}
+    elif tags is None or tags - {"GPSInfo"}:
+        # The Exif sub-IFD holds everything except the IFD0 and GPS tags
+        merged.update(exif.get_ifd(_EXIF_IFD_TAG))
+
+    if _GPSINFO_TAG in merged:
+        if tags is None or "GPSInfo" in tags:
+            merged[_GPSINFO_TAG] = exif.get_ifd(_GPSINFO_TAG)
+        else:
+            del merged[_GPSINFO_TAG]
+
+    return merged
+
+
+def _insert_jpeg_exif(data: bytes, exif_data: bytes) -> Optional[bytes]:
+    """
+    Replace the EXIF segment of a JPEG stream, leaving the scan data untouched.
+
+    Args:
+        data: The complete JPEG file contents.
+        exif_data: The APP1 payload to insert, including the ``Exif`` header.
+
+    Returns:
+        The updated JPEG bytes, or None if the stream could not be parsed as a
+        JPEG or the payload does not fit in a single segment.
+    """
+    if len(exif_data) + 2 > 0xFFFF:
+        return None
+
+    app1 = b"\xff\xe1" + struct.pack(">H", len(exif_data) + 2) + exif_data
+    chunks = [_JPEG_SOI]
+
+    for marker, start, end in _iter_jpeg_segments(data):
+        if marker == _JPEG_APP1 and data[start + 4 : start + 10] == _EXIF_HEADER:
+            # Drop the existing EXIF segment
+            continue
+        if app1 and marker != _JPEG_APP0:
+            # EXIF goes right after the JFIF header
+            chunks.append(app1)
+            app1 = b""
+        chunks.append(data[start:end])
+        if marker in (_JPEG_SOS, _JPEG_EOI):
+            return b"".join(chunks)
+
+    return None
+
+
+def _decode_exif(
+    exif: Dict[int, Any],
+    tags: Optional[Set[str]] = None,
+    stop_tag: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Translate numeric EXIF tag IDs into human-readable tag names."""
+    exif_data = {}
+
+    for tag_id, value in exif.items():
+        tag = TAGS.get(tag_id, tag_id)
+        if tags is not None and tag not in tags:
+            if tag == stop_tag:
+                break
+            continue
+
+        # Handle GPS data specially
+        if tag == "GPSInfo":
+            gps_data = {}
+            for gps_tag_id, gps_value in value.items():
+                gps_tag = GPSTAGS.get(gps_tag_id, gps_tag_id)
+                gps_data[gps_tag] = gps_value
+            exif_data[tag] = gps_data
+        else:
+            exif_data[tag] = value
+
+        if tag == stop_tag:
+            break
+
+    return exif_data
+
+
+def _extract_exif_from_img(
+    img: Image.Image,
+    tags: Optional[Set[str]] = None,
+    stop_tag: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Extract EXIF metadata from an already opened image."""
+    if hasattr(img, "_getexif") and callable(img._getexif):
+        exif = img._getexif()
+        if exif:
+            return _decode_exif(exif, tags, stop_tag)
+
+    return {}
+
+
+def _read_xmp_packet(img: Image.Image) -> Optional[Union[str, bytes]]:
+    """
+    Get the raw XMP packet of an already opened image.
+
+    Args:
+        img: The opened image.
+
+    Returns:
+        The XMP packet, an empty bytes object if the image has none, or None
+        if PIL does not expose XMP for the image format.
+    """
+    if img.format in ("JPEG", "MPO"):
+        for segment, content in getattr(img, "applist", []):
+            if segment == "APP1" and content.startswith(_XMP_HEADER):
+                return content[len(_XMP_HEADER) :]
+        return b""
+    if img.format == "PNG":
+        return img.info.get("XML:com.adobe.xmp", b"")
+    if img.format == "WEBP":
+        return img.info.get("xmp", b"")
+    if img.format == "TIFF":
+        return img.tag_v2.get(_TIFF_XMP_TAG, b"")
+    return None
+
 
-def extract_exif(image_path: Union[str, Path]) -> Dict[str, Any]:
+def extract_exif(
+    image_path: Union[str, Path],
+    *,
+    tags: Optional[Set[str]] = None,
+    stop_tag: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Extract EXIF metadata from an image file.
 
+    For JPEG files only the APP1 segment is read and parsed; other formats
+    fall back to opening the image with PIL.
+
     Args:
         image_path: Path to the image file.
+        tags: Human-readable names of the tags to extract (e.g. {'GPSInfo'}).
+              If None, all tags are extracted.
+        stop_tag: Human-readable name of a tag after which decoding stops
+                  (e.g. 'Model'). Tags that follow it are not returned.
 
     Returns:
         A dictionary containing the EXIF metadata with human-readable tags.
     """
     try:
+        segment = _read_jpeg_exif_segment(image_path)
+        if segment is not None:
+            if not segment:
+                return {}
+            exif = Image.Exif()
+            exif.load(segment)
+            return _decode_exif(_merge_exif(exif, tags, stop_tag), tags, stop_tag)
+
         with Image.open(image_path) as img:
-            exif_data = {}
-
-            if hasattr(img, "_getexif") and callable(img._getexif):
-                exif = img._getexif()
-                if exif:
-                    for tag_id, value in exif.items():
-                        tag = TAGS.get(tag_id, tag_id)
-
-                        # Handle GPS data specially
-                        if tag == "GPSInfo":
-                            gps_data = {}
-                            for gps_tag_id, gps_value in value.items():
-                                gps_tag = GPSTAGS.get(gps_tag_id, gps_tag_id)
-                                gps_data[gps_tag] = gps_value
-                            exif_data[tag] = gps_data
-                        else:
-                            exif_data[tag] = value
-
-            return exif_data
-    except Exception as e:
-        print(f"Error extracting EXIF data: {e}")
+            return _extract_exif_from_img(img, tags, stop_tag)
+    except Exception:
+        logger.debug("Error extracting EXIF data from %s", image_path, exc_info=True)
         return {}
 
 
+def extract_exif_batch(
+    image_paths: Iterable[Union[str, Path]], max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract EXIF metadata from many image files in parallel.
+
+    The files are parsed in a process pool so independent parses are not
+    serialised behind the GIL. On platforms that start workers with spawn
+    (Windows, macOS), scripts must call this from under an
+    ``if __name__ == "__main__":`` guard.
+
+    Args:
+        image_paths: Paths to the image files.
+        max_workers: The maximum number of worker processes to use.
+                     If None, the number of CPUs is used.
+
+    Returns:
+        A dictionary mapping each input path (as a string) to its EXIF metadata.
+
+    Raises:
+        ValueError: If max_workers is less than 1.
+    """
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("max_workers must be greater than 0")
+
+    paths = [str(path) for path in image_paths]
+
+    # Never start more workers than there are files to parse
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+
+    # A single worker runs inline rather than paying for a process pool
+    if workers <= 1:
+        return {path: extract_exif(path) for path in paths}
+
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(extract_exif, paths, chunksize=chunksize)
+        return dict(zip(paths, results))
+
+
 def get_image_metadata(image_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Get comprehensive metadata from an image file.
@@ -72,35 +420,61 @@ def get_image_metadata(image_path: Union[str, Path]) -> Dict[str, Any]:
                 "info": img.info,
             }
 
-            # EXIF data
-            metadata["exif"] = extract_exif(image_path)
+            # Skip the metadata kinds the format cannot carry
+            capabilities = _METADATA_CAPABILITIES.get(img.format, _ALL_METADATA)
+
+            # EXIF data, read from the handle that is already open
+            if "exif" in capabilities:
+                metadata["exif"] = _extract_exif_from_img(img)
 
             # Extract IPTC data if available
-            try:
-                from PIL import IptcImagePlugin
-                iptc_data = IptcImagePlugin.getiptcinfo(img)
-                if iptc_data:
-                    metadata["iptc"] = iptc_data
-            except (ImportError, Exception):
-                pass
-
-            # Extract XMP data if available
-            try:
-                from libxmp import XMPFiles
-                xmp_file = XMPFiles(file_path=str(image_path))
-                xmp_data = xmp_file.get_xmp()
-                if xmp_data:
-                    metadata["xmp"] = xmp_data
-                xmp_file.close_file()
-            except (ImportError, Exception):
-                pass
+            if "iptc" in capabilities:
+                try:
+                    iptc_data = IptcImagePlugin.getiptcinfo(img)
+                    if iptc_data:
+                        metadata["iptc"] = iptc_data
+                except Exception:
+                    pass
+
+            # Extract XMP data if libxmp is installed
+            if "xmp" in capabilities and XMPFiles is not None:
+                try:
+                    xmp_packet = _read_xmp_packet(img)
+                    if xmp_packet is None:
+                        # PIL does not expose XMP for this format
+                        xmp_file = XMPFiles(file_path=str(image_path))
+                        xmp_data = xmp_file.get_xmp()
+                        xmp_file.close_file()
+                    elif xmp_packet:
+                        if isinstance(xmp_packet, bytes):
+                            xmp_packet = xmp_packet.decode("utf-8")
+                        xmp_data = XMPMeta()
+                        xmp_data.parse_from_str(xmp_packet, xmpmeta_wrap=False)
+                    else:
+                        xmp_data = None
+                    if xmp_data:
+                        metadata["xmp"] = xmp_data
+                except Exception:
+                    pass
 
             return metadata
-    except Exception as e:
-        print(f"Error getting image metadata: {e}")
+    except Exception:
+        logger.debug("Error getting image metadata from %s", image_path, exc_info=True)
         return metadata
 
 
+def _find_creation_date(exif: Image.Exif) -> Optional[str]:
+    """Look up the date tags by numeric ID without decoding the whole EXIF."""
+    exif_ifd = exif.get_ifd(_EXIF_IFD_TAG)
+
+    # Try different EXIF tags that might contain the date
+    for tag_id in (_DATETIME_ORIGINAL_TAG, _DATETIME_DIGITIZED_TAG):
+        if tag_id in exif_ifd:
+            return exif_ifd[tag_id]
+
+    return exif.get(_DATETIME_TAG)
+
+
 def get_creation_date(image_path: Union[str, Path]) -> Optional[str]:
     """
     Extract the creation date from image metadata.
@@ -111,16 +485,29 @@ def get_creation_date(image_path: Union[str, Path]) -> Optional[str]:
     Returns:
         The creation date as a string, or None if not available.
     """
-    exif_data = extract_exif(image_path)
+    try:
+        segment = _read_jpeg_exif_segment(image_path)
+        if segment is not None:
+            if not segment:
+                return None
+            exif = Image.Exif()
+            exif.load(segment)
+            return _find_creation_date(exif)
 
-    # Try different EXIF tags that might contain the date
-    date_tags = ["DateTimeOriginal", "DateTimeDigitized", "DateTime"]
+        with Image.open(image_path) as img:
+            return _find_creation_date(img.getexif())
+    except Exception:
+        logger.debug(
+            "Error extracting creation date from %s", image_path, exc_info=True
+        )
+        return None
 
-    for tag in date_tags:
-        if tag in exif_data:
-            return exif_data[tag]
 
-    return None
+def _dms_to_decimal(value: Tuple[Any, Any, Any], ref: str) -> float:
+    """Convert a degrees/minutes/seconds triple to signed decimal degrees."""
+    degrees, minutes, seconds = value
+    sign = -1.0 if ref in _NEGATIVE_GPS_REFS else 1.0
+    return sign * (degrees + minutes * _ARCMINUTE + seconds * _ARCSECOND)
 
 
 def get_gps_coordinates(image_path: Union[str, Path]) -> Optional[Dict[str, float]]:
@@ -133,7 +520,7 @@ def get_gps_coordinates(image_path: Union[str, Path]) -> Optional[Dict[str, floa
     Returns:
         A dictionary with 'latitude' and 'longitude' keys, or None if not available.
     """
-    exif_data = extract_exif(image_path)
+    exif_data = extract_exif(image_path, tags={"GPSInfo"})
 
     if "GPSInfo" not in exif_data:
         return None
@@ -144,34 +531,98 @@ def get_gps_coordinates(image_path: Union[str, Path]) -> Optional[Dict[str, floa
     if "GPSLatitude" not in gps_info or "GPSLongitude" not in gps_info:
         return None
 
-    # Convert GPS coordinates from degrees/minutes/seconds to decimal degrees
-    def convert_to_decimal(value, ref):
-        degrees, minutes, seconds = value
-        decimal = float(degrees) + float(minutes) / 60 + float(seconds) / 3600
-        if ref in ["S", "W"]:
-            decimal = -decimal
-        return decimal
-
     try:
-        latitude = convert_to_decimal(
+        latitude = _dms_to_decimal(
             gps_info["GPSLatitude"], gps_info.get("GPSLatitudeRef", "N")
         )
-        longitude = convert_to_decimal(
+        longitude = _dms_to_decimal(
             gps_info["GPSLongitude"], gps_info.get("GPSLongitudeRef", "E")
         )
 
         return {"latitude": latitude, "longitude": longitude}
-    except Exception as e:
-        print(f"Error converting GPS coordinates: {e}")
+    except Exception:
+        logger.debug(
+            "Error converting GPS coordinates from %s", image_path, exc_info=True
+        )
         return None
 
 
+async def _run_in_threads(
+    func: Callable[[str], Any],
+    image_paths: Iterable[Union[str, Path]],
+    concurrency: int,
+) -> Dict[str, Any]:
+    """Run a per-file metadata reader over many files in the default thread pool."""
+    if concurrency <= 0:
+        raise ValueError("concurrency must be greater than 0")
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    paths = [str(path) for path in image_paths]
+
+    async def run(path: str) -> Any:
+        # Bound the number of files open at the same time
+        async with semaphore:
+            return await loop.run_in_executor(None, func, path)
+
+    results = await asyncio.gather(*(run(path) for path in paths))
+    return dict(zip(paths, results))
+
+
+async def get_creation_dates_async(
+    image_paths: Iterable[Union[str, Path]], *, concurrency: int = 32
+) -> Dict[str, Optional[str]]:
+    """
+    Extract the creation dates of many image files concurrently.
+
+    Reads are dispatched to worker threads so disk I/O for different files
+    overlaps.
+
+    Args:
+        image_paths: Paths to the image files.
+        concurrency: The maximum number of files read at the same time.
+
+    Returns:
+        A dictionary mapping each input path (as a string) to its creation date,
+        or None if not available.
+
+    Raises:
+        ValueError: If concurrency is not positive.
+    """
+    return await _run_in_threads(get_creation_date, image_paths, concurrency)
+
+
+async def get_gps_coordinates_async(
+    image_paths: Iterable[Union[str, Path]], *, concurrency: int = 32
+) -> Dict[str, Optional[Dict[str, float]]]:
+    """
+    Extract the GPS coordinates of many image files concurrently.
+
+    Reads are dispatched to worker threads so disk I/O for different files
+    overlaps.
+
+    Args:
+        image_paths: Paths to the image files.
+        concurrency: The maximum number of files read at the same time.
+
+    Returns:
+        A dictionary mapping each input path (as a string) to its coordinates,
+        or None if not available.
+
+    Raises:
+        ValueError: If concurrency is not positive.
+    """
+    return await _run_in_threads(get_gps_coordinates, image_paths, concurrency)
+
+
 def strip_all_metadata(
     image_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None
 ) -> bool:
     """
     Strip all metadata from an image file.
 
+    JPEG files are rewritten at the segment level so the compressed image data
+    is copied as-is; other formats are re-encoded from a copy of the pixels.
+
     Args:
         image_path: Path to the input image file.
         output_path: Path where the stripped image will be saved. If None, overwrites the original.
@@ -183,19 +634,25 @@ def strip_all_metadata(
         output_path = image_path
 
     try:
+        output_suffix = Path(output_path).suffix.lower()
+        if Image.registered_extensions().get(output_suffix) == "JPEG":
+            stripped = _strip_jpeg_metadata(Path(image_path).read_bytes())
+            if stripped is not None:
+                Path(output_path).write_bytes(stripped)
+                return True
+
         # Open the image
         with Image.open(image_path) as img:
-            # Create a new image with the same content but without metadata
-            data = list(img.getdata())
-            new_img = Image.new(img.mode, img.size)
-            new_img.putdata(data)
+            # Copy the pixels without carrying over the metadata
+            new_img = img.copy()
+            new_img.info = {}
 
             # Save the new image
             new_img.save(output_path)
 
             return True
-    except Exception as e:
-        print(f"Error stripping metadata: {e}")
+    except Exception:
+        logger.debug("Error stripping metadata from %s", image_path, exc_info=True)
         return False
 
 
@@ -203,6 +660,9 @@ def copy_metadata(source_path: Union[str, Path], target_path: Union[str, Path])
     """
     Copy metadata from one image to another.
 
+    For JPEG targets only the EXIF segment is rewritten, so the compressed
+    image data is not re-encoded.
+
     Args:
         source_path: Path to the source image (metadata donor).
         target_path: Path to the target image (metadata recipient).
@@ -214,26 +674,43 @@ def copy_metadata(source_path: Union[str, Path], target_path: Union[str, Path])
         # This is a simplified version that only works with EXIF data
         # A more comprehensive solution would require additional libraries
 
-        # Extract metadata from source
-        with Image.open(source_path) as source_img:
-            if not hasattr(source_img, "_getexif") or not callable(source_img._getexif):
-                return False
-
-            exif_data = source_img._getexif()
-            if not exif_data:
-                return False
+        # Extract the raw EXIF block from the source
+        exif_data = _read_jpeg_exif_segment(source_path)
+        if exif_data is None:
+            with Image.open(source_path) as source_img:
+                exif_data = source_img.info.get("exif", b"")
+        if not exif_data:
+            return False
+        if not exif_data.startswith(_EXIF_HEADER):
+            # Some formats (e.g. WebP) store a bare TIFF block, but an APP1
+            # segment is only read as EXIF with the header in front
+            exif_data = _EXIF_HEADER + exif_data
+
+        exif = Image.Exif()
+        exif.load(exif_data)
+        if not len(exif):
+            return False
+
+        # JPEG targets only get their APP1 segment replaced
+        updated = _insert_jpeg_exif(Path(target_path).read_bytes(), exif_data)
+        if updated is not None:
+            Path(target_path).write_bytes(updated)
+            return True
 
         # Open target image
         with Image.open(target_path) as target_img:
-            # Create a new image with the target content
-            data = list(target_img.getdata())
-            new_img = Image.new(target_img.mode, target_img.size)
-            new_img.putdata(data)
+            # Copy the target pixels so the file can be overwritten
+            new_img = target_img.copy()
 
             # Save with the source metadata
             new_img.save(target_path, exif=exif_data)
 
             return True
-    except Exception as e:
-        print(f"Error copying metadata: {e}")
+    except Exception:
+        logger.debug(
+            "Error copying metadata from %s to %s",
+            source_path,
+            target_path,
+            exc_info=True,
+        )
         return False
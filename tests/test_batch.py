@@ -3,6 +3,8 @@ Unit tests for the BatchProcessor class.
 """
 
 import os
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -15,38 +17,42 @@ from gneiss.core.batch import BatchProcessor
 class TestBatchProcessor(unittest.TestCase):
     """Test cases for the BatchProcessor class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the read-only input images shared by all tests."""
         # Create a test directory
-        self.test_dir = Path("tests/test_output")
-        self.test_dir.mkdir(parents=True, exist_ok=True)
+        cls._tmp = tempfile.TemporaryDirectory(prefix="gneiss_test_")
+        cls.test_dir = Path(cls._tmp.name)
 
         # Create a directory for input test images
-        self.input_dir = self.test_dir / "input"
-        self.input_dir.mkdir(exist_ok=True)
+        cls.input_dir = cls.test_dir / "input"
+        cls.input_dir.mkdir(exist_ok=True)
+
+        # Create some test images
+        cls.test_images = []
+        for i in range(5):
+            path = cls.input_dir / f"test_image_{i}.png"
+            cls._create_test_image(path, width=100, height=100, color=(255, i * 50, 0))
+            cls.test_images.append(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared input images."""
+        cls._tmp.cleanup()
 
+    def setUp(self):
+        """Set up test fixtures."""
         # Create a directory for output test images
         self.output_dir = self.test_dir / "output"
         self.output_dir.mkdir(exist_ok=True)
 
-        # Create some test images
-        self.test_images = []
-        for i in range(5):
-            path = self.input_dir / f"test_image_{i}.png"
-            self._create_test_image(path, width=100, height=100, color=(255, i * 50, 0))
-            self.test_images.append(path)
-
     def tearDown(self):
         """Tear down test fixtures."""
-        # Clean up test files
-        for file in self.test_dir.glob("**/*"):
-            if file.is_file():
-                try:
-                    file.unlink()
-                except Exception:
-                    pass
-
-    def _create_test_image(self, path, width=100, height=100, color=(255, 0, 0)):
+        # Clean up the outputs of this test only
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    @staticmethod
+    def _create_test_image(path, width=100, height=100, color=(255, 0, 0)):
         """Create a simple test image."""
         img = PILImage.new("RGB", (width, height), color)
         img.save(path)
@@ -192,14 +198,14 @@ class TestBatchProcessor(unittest.TestCase):
             processor = BatchProcessor(max_workers=max_workers)
             
             # Time the operation
-            start_time = time.time()
+            start_time = time.perf_counter()
             results = processor.process_images(
                 image_paths=self.test_images,
                 operation=lambda img: img.resize(width=50),
                 output_dir=self.output_dir / f"workers_{max_workers}",
                 show_progress=False,
             )
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             
             # Verify all processed
             self.assertEqual(len(results), len(self.test_images))
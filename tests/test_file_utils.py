@@ -3,9 +3,14 @@ Unit tests for the file utility functions.
 """
 
 import os
+import re
+import shutil
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
+from unittest import mock
 
 from gneiss.utils.file_utils import (
     apply_rename,
@@ -13,6 +18,7 @@ from gneiss.utils.file_utils import (
     generate_sequential_names,
     get_files_by_extension,
     find_images,
+    find_images_grouped,
     ensure_directory_exists,
     get_unique_filename,
     generate_output_filename,
@@ -23,94 +29,105 @@ from gneiss.utils.file_utils import (
     filter_files_by_pattern
 )
 
+_COMPILED_TEST_PATTERN = re.compile(r"test_file_(\d+)")
+_KB_PAYLOAD = b"x" * 1024
+
+
+def _bulk_touch(paths: List[str]) -> None:
+    """Create empty files with one open/close pair per path."""
+    for path in paths:
+        fd = os.open(path, os.O_CREAT | os.O_WRONLY, 0o644)
+        os.close(fd)
+
+
+def _parallel_touch(paths: List[str], max_workers: int = 8) -> None:
+    """Create empty files, spreading the paths across worker threads."""
+    chunks = [paths[i::max_workers] for i in range(max_workers)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_bulk_touch, chunks))
+
 
 class TestFileUtils(unittest.TestCase):
     """Test cases for the file utility functions."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the read-only file tree shared by all tests."""
         # Create a test directory
-        self.test_dir = Path("tests/test_output")
-        self.test_dir.mkdir(parents=True, exist_ok=True)
-        
+        cls._tmp = tempfile.TemporaryDirectory(prefix="gneiss_test_")
+        cls.test_dir = Path(cls._tmp.name)
+
         # Create subdirectories
-        self.subdir1 = self.test_dir / "subdir1"
-        self.subdir1.mkdir(exist_ok=True)
-        
-        self.subdir2 = self.test_dir / "subdir2"
-        self.subdir2.mkdir(exist_ok=True)
+        cls.subdir1 = cls.test_dir / "subdir1"
+        cls.subdir1.mkdir(exist_ok=True)
 
-        # Create some test files with different extensions
-        self.test_files = []
-        
-        # Root directory files
-        for ext in [".jpg", ".png", ".txt", ".pdf"]:
-            for i in range(2):
-                path = self.test_dir / f"test_file_{i}{ext}"
-                path.touch()
-                self.test_files.append(path)
-        
-        # Subdirectory 1 files
-        for ext in [".jpg", ".png"]:
-            for i in range(2):
-                path = self.subdir1 / f"sub1_file_{i}{ext}"
-                path.touch()
-                self.test_files.append(path)
-        
-        # Subdirectory 2 files
-        for ext in [".gif", ".webp"]:
-            for i in range(2):
-                path = self.subdir2 / f"sub2_file_{i}{ext}"
-                path.touch()
-                self.test_files.append(path)
-        
-        # Create a test file with content for size testing
-        self.content_file = self.test_dir / "content_file.txt"
-        with open(self.content_file, "w") as f:
-            f.write("x" * 1024)  # 1KB of data
-        self.test_files.append(self.content_file)
-
-    def tearDown(self):
-        """Tear down test fixtures."""
-        # Clean up test files recursively
-        def remove_recursively(path):
-            if path.is_dir():
-                for item in path.iterdir():
-                    remove_recursively(item)
-                path.rmdir()
-            elif path.is_file():
-                path.unlink()
-        
-        # Remove all test files and directories
-        if self.test_dir.exists():
-            for item in self.test_dir.iterdir():
-                remove_recursively(item)
+        cls.subdir2 = cls.test_dir / "subdir2"
+        cls.subdir2.mkdir(exist_ok=True)
 
-    def test_get_files_by_extension(self):
-        """Test getting files by extension."""
-        # Get all image files
-        image_files = get_files_by_extension(
-            self.test_dir, extensions=[".jpg", ".png"], recursive=False
+        # Create some test files with different extensions
+        base = os.fspath(cls.test_dir)
+        sub1 = os.fspath(cls.subdir1)
+        sub2 = os.fspath(cls.subdir2)
+        cls.test_file_strs = (
+            # Root directory files
+            [
+                os.path.join(base, f"test_file_{i}{ext}")
+                for ext in (".jpg", ".png", ".txt", ".pdf")
+                for i in (0, 1)
+            ]
+            # Subdirectory 1 files
+            + [
+                os.path.join(sub1, f"sub1_file_{i}{ext}")
+                for ext in (".jpg", ".png")
+                for i in (0, 1)
+            ]
+            # Subdirectory 2 files
+            + [
+                os.path.join(sub2, f"sub2_file_{i}{ext}")
+                for ext in (".gif", ".webp")
+                for i in (0, 1)
+            ]
         )
+        _parallel_touch(cls.test_file_strs)
 
-        # Check that we got the expected number of files
-        self.assertEqual(len(image_files), 4)  # 2 JPG + 2 PNG
-
-        # Check that all files have the expected extensions
-        for file in image_files:
-            self.assertIn(file.suffix.lower(), [".jpg", ".png"])
+        # Create a test file with content for size testing
+        cls.content_file = cls.test_dir / "content_file.txt"
+        cls.content_file.write_bytes(_KB_PAYLOAD)  # 1KB of data
+        cls.test_file_strs.append(os.fspath(cls.content_file))
 
-        # Get only JPG files
-        jpg_files = get_files_by_extension(
-            self.test_dir, extensions=[".jpg"], recursive=False
-        )
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down the shared file tree."""
+        cls._tmp.cleanup()
 
-        # Check that we got the expected number of files
-        self.assertEqual(len(jpg_files), 2)  # 2 JPG
+    def _make_scratch_dir(self):
+        """Create a per-test directory for tests that modify the filesystem."""
+        scratch_dir = tempfile.TemporaryDirectory(prefix="gneiss_test_")
+        self.addCleanup(scratch_dir.cleanup)
+        return Path(scratch_dir.name)
 
-        # Check that all files have the expected extension
-        for file in jpg_files:
-            self.assertEqual(file.suffix.lower(), ".jpg")
+    def test_get_files_by_extension(self):
+        """Test getting files by extension."""
+        cases = [
+            # (extensions, recursive, expected_count)
+            ([".jpg", ".png"], False, 4),  # 2 JPG + 2 PNG
+            ([".jpg"], False, 2),  # 2 JPG
+            ([".jpg", ".png"], True, 8),  # 4 JPG + 4 PNG
+            ([".gif", ".webp"], False, 0),  # only in subdir2
+            ([".gif", ".webp"], True, 4),  # 2 GIF + 2 WEBP
+        ]
+        for extensions, recursive, expected_count in cases:
+            with self.subTest(extensions=extensions, recursive=recursive):
+                files = get_files_by_extension(
+                    self.test_dir, extensions=extensions, recursive=recursive
+                )
+
+                # Check that we got the expected number of files
+                self.assertEqual(len(files), expected_count)
+
+                # Check that all files have the expected extensions
+                suffixes = {file.suffix.lower() for file in files}
+                self.assertLessEqual(suffixes, set(extensions))
 
     def test_get_files_by_extension_nonexistent_dir(self):
         """Test getting files from a nonexistent directory."""
@@ -122,7 +139,7 @@ class TestFileUtils(unittest.TestCase):
     def test_batch_rename(self):
         """Test batch renaming files."""
         # Get all test files
-        files = [str(file) for file in self.test_files]
+        files = self.test_file_strs
 
         # Generate a rename map
         rename_map = batch_rename(
@@ -136,20 +153,33 @@ class TestFileUtils(unittest.TestCase):
         self.assertEqual(len(rename_map), len(files))
 
         # Check that the rename map has the expected replacements
+        matching = {
+            original: new
+            for original, new in rename_map.items()
+            if "test_file" in os.path.basename(original)
+        }
+        self.assertEqual(len(matching), 8)
+        offenders = [
+            (original, new)
+            for original, new in matching.items()
+            if "renamed_file" not in new or "test_file" in new
+        ]
+        self.assertFalse(offenders, f"First unexpected rename: {offenders[:1]}")
+
+        # Files whose names don't contain the pattern keep their path
         for original, new in rename_map.items():
-            self.assertIn("test_file", original)
-            self.assertIn("renamed_file", new)
-            self.assertNotIn("test_file", new)
+            if original not in matching:
+                self.assertEqual(new, original)
 
     def test_batch_rename_with_regex(self):
         """Test batch renaming files with regex."""
         # Get all test files
-        files = [str(file) for file in self.test_files]
+        files = self.test_file_strs
 
         # Generate a rename map with regex
         rename_map = batch_rename(
             files=files,
-            pattern=r"test_file_(\d+)",
+            pattern=_COMPILED_TEST_PATTERN,
             replacement=r"file_\1_renamed",
             use_regex=True,
         )
@@ -158,17 +188,28 @@ class TestFileUtils(unittest.TestCase):
         self.assertEqual(len(rename_map), len(files))
 
         # Check that the rename map has the expected replacements
+        matching = {
+            original: new
+            for original, new in rename_map.items()
+            if _COMPILED_TEST_PATTERN.search(os.path.basename(original))
+        }
+        self.assertEqual(len(matching), 8)
+        offenders = [
+            (original, new)
+            for original, new in matching.items()
+            if "file_" not in new or "_renamed" not in new or "test_file_" in new
+        ]
+        self.assertFalse(offenders, f"First unexpected rename: {offenders[:1]}")
+
+        # Files whose names don't match the pattern keep their path
         for original, new in rename_map.items():
-            self.assertIn("test_file_", original)
-            self.assertIn("file_", new)
-            self.assertIn("_renamed", new)
-            self.assertNotIn("test_file_", new)
+            if original not in matching:
+                self.assertEqual(new, original)
 
     def test_apply_rename(self):
         """Test applying a rename map."""
         # Create some specific test files for renaming
-        rename_test_dir = self.test_dir / "rename_test"
-        rename_test_dir.mkdir(exist_ok=True)
+        rename_test_dir = self._make_scratch_dir()
 
         test_files = []
         for i in range(3):
@@ -191,22 +232,27 @@ class TestFileUtils(unittest.TestCase):
             self.assertTrue(success)
 
         # Check that the files were actually renamed
+        with os.scandir(rename_test_dir) as entries:
+            present = {entry.name for entry in entries}
         for original, new in rename_map.items():
-            self.assertFalse(Path(original).exists())
-            self.assertTrue(Path(new).exists())
+            self.assertNotIn(Path(original).name, present)
+            self.assertIn(Path(new).name, present)
 
     def test_apply_rename_conflict(self):
         """Test applying a rename map with conflicts."""
         # Create some specific test files for renaming
-        conflict_test_dir = self.test_dir / "conflict_test"
-        conflict_test_dir.mkdir(exist_ok=True)
+        conflict_test_dir = self._make_scratch_dir()
 
         # Create two files: one to be renamed and one that will cause a conflict
         source_file = conflict_test_dir / "source.txt"
         target_file = conflict_test_dir / "target.txt"
 
         source_file.touch()
-        target_file.touch()
+        try:
+            os.link(source_file, target_file)
+        except OSError:
+            # Hard links may be unsupported or need extra privileges
+            target_file.touch()
 
         # Generate a rename map with a conflict
         rename_map = {str(source_file): str(target_file)}  # This will cause a conflict
@@ -225,7 +271,8 @@ class TestFileUtils(unittest.TestCase):
     def test_generate_sequential_names(self):
         """Test generating sequential filenames."""
         # Count the number of files in the test directory
-        file_count = len([f for f in self.test_dir.iterdir() if f.is_file()])
+        with os.scandir(self.test_dir) as entries:
+            file_count = sum(1 for entry in entries if entry.is_file())
 
         # Generate sequential names
         names = generate_sequential_names(
@@ -264,16 +311,27 @@ class TestFileUtils(unittest.TestCase):
         images = find_images(self.test_dir, recursive=False)
         expected_count = 4  # 2 jpg + 2 png in root dir
         self.assertEqual(len(images), expected_count)
-        
+
         # Test recursive search
-        images_recursive = find_images(self.test_dir, recursive=True)
-        expected_count_recursive = 8  # 2 jpg + 2 png + 2 gif + 2 webp
+        images_recursive = find_images(self.test_dir)
+        expected_count_recursive = 12  # 4 jpg + 4 png + 2 gif + 2 webp
         self.assertEqual(len(images_recursive), expected_count_recursive)
-        
+
         # Test with specific extensions
-        jpg_png_images = find_images(self.test_dir, extensions=[".jpg", ".png"], recursive=True)
+        images_jpg_png = find_images(self.test_dir, extensions=[".jpg", ".png"])
         expected_jpg_png = 8  # 2 jpg + 2 png in root + 2 jpg + 2 png in subdir1
-        self.assertEqual(len(jpg_png_images), expected_jpg_png)
+        self.assertEqual(len(images_jpg_png), expected_jpg_png)
+
+        # The grouped variant partitions the same results by extension
+        groups = find_images_grouped(self.test_dir)
+        self.assertEqual(
+            sorted(path for paths in groups.values() for path in paths),
+            images_recursive,
+        )
+        self.assertEqual(sorted(groups[".jpg"] + groups[".png"]), images_jpg_png)
+        groups_top_level = find_images_grouped(self.test_dir, recursive=False)
+        self.assertEqual(set(groups_top_level), {".jpg", ".png"})
+        self.assertEqual(sum(map(len, groups_top_level.values())), expected_count)
         
         # Test with non-existent directory
         with self.assertRaises(ValueError):
@@ -286,56 +344,74 @@ class TestFileUtils(unittest.TestCase):
         self.assertTrue(self.test_dir.exists())
         
         # Test with new directory
-        new_dir = self.test_dir / "new_subdir"
+        scratch_dir = self._make_scratch_dir()
+        new_dir = scratch_dir / "new_subdir"
         ensure_directory_exists(new_dir)
         self.assertTrue(new_dir.exists())
         
         # Test with nested directories
-        nested_dir = self.test_dir / "parent" / "child" / "grandchild"
+        nested_dir = scratch_dir / "parent" / "child" / "grandchild"
+        ensure_directory_exists(nested_dir)
+        self.assertTrue(nested_dir.exists())
+
+        # Directories removed after creation are created again
+        shutil.rmtree(scratch_dir / "parent")
         ensure_directory_exists(nested_dir)
         self.assertTrue(nested_dir.exists())
+
+        # Existing files without an extension are left alone
+        readme = scratch_dir / "README"
+        readme.touch()
+        ensure_directory_exists(readme)
+        self.assertTrue(readme.is_file())
     
     def test_get_unique_filename(self):
         """Test getting unique filename."""
         # Test with non-existent file
         unique_name = get_unique_filename(self.test_dir / "new_file.jpg")
-        self.assertEqual(unique_name, self.test_dir / "new_file.jpg")
+        self.assertEqual(unique_name, os.path.join(self.test_dir, "new_file.jpg"))
         
         # Test with existing file
         existing_file = self.test_dir / "test_file_0.jpg"  # This exists from setUp
         unique_name2 = get_unique_filename(existing_file)
-        self.assertTrue(unique_name2 != existing_file)
-        self.assertTrue("(1)" in str(unique_name2))
+        self.assertEqual(unique_name2, os.path.join(self.test_dir, "test_file_0_1.jpg"))
         
         # Test with multiple existing versions
-        for i in range(3):
-            test_name = self.test_dir / f"test_unique_{i}.txt"
+        scratch_dir = self._make_scratch_dir()
+        (scratch_dir / "test_unique.txt").touch()
+        for i in range(1, 3):
+            test_name = scratch_dir / f"test_unique_{i}.txt"
             test_name.touch()
         
-        unique_name3 = get_unique_filename(self.test_dir / "test_unique_0.txt")
-        self.assertTrue("(3)" in str(unique_name3))
+        unique_name3 = get_unique_filename(scratch_dir / "test_unique.txt")
+        self.assertEqual(unique_name3, os.path.join(scratch_dir, "test_unique_3.txt"))
     
     def test_generate_output_filename(self):
         """Test generating output filename."""
         input_file = self.test_dir / "test_file_0.jpg"
-        output_dir = self.test_dir / "output"
+        output_dir = self._make_scratch_dir() / "output"
         
         # Test with default parameters
         output_path = generate_output_filename(input_file, output_dir=output_dir)
-        self.assertEqual(output_path, output_dir / "test_file_0.jpg")
+        self.assertEqual(output_path, os.path.join(output_dir, "test_file_0.jpg"))
+        self.assertTrue(output_dir.is_dir())
         
         # Test with suffix
         output_path2 = generate_output_filename(input_file, output_dir=output_dir, suffix="_processed")
-        self.assertEqual(output_path2, output_dir / "test_file_0_processed.jpg")
+        self.assertEqual(
+            output_path2, os.path.join(output_dir, "test_file_0_processed.jpg")
+        )
         
-        # Test with different extension
-        output_path3 = generate_output_filename(input_file, output_dir=output_dir, extension=".png")
-        self.assertEqual(output_path3, output_dir / "test_file_0.png")
+        # Test with different output format
+        output_path3 = generate_output_filename(
+            input_file, output_dir=output_dir, output_format="PNG"
+        )
+        self.assertEqual(output_path3, os.path.join(output_dir, "test_file_0.png"))
     
     def test_group_files_by_extension(self):
         """Test grouping files by extension."""
         # Get all files
-        all_files = [str(f) for f in self.test_files]
+        all_files = self.test_file_strs
         
         # Group by extension
         grouped = group_files_by_extension(all_files)
@@ -358,32 +434,35 @@ class TestFileUtils(unittest.TestCase):
         
         # Test with human-readable format
         human_size = get_file_size(self.content_file, human_readable=True)
-        self.assertTrue(human_size.startswith("1.0"))  # Should be around 1.0 KB
+        self.assertEqual(human_size, "1.00KB")
         
-        # Test with bytes input
-        human_size2 = get_file_size(1048576, human_readable=True)  # 1MB in bytes
-        self.assertTrue(human_size2.startswith("1.0"))
+        # Directories are rejected
+        with self.assertRaises(ValueError):
+            get_file_size(self.test_dir)
     
     def test_filter_files_by_pattern(self):
         """Test filtering files by pattern."""
         # Get all files
-        all_files = [str(f) for f in self.test_files]
+        all_files = self.test_file_strs
         
-        # Test with simple pattern
-        filtered = filter_files_by_pattern(all_files, "test_file")
-        self.assertTrue(len(filtered) > 0)
+        # Test with a single wildcard pattern
+        filtered = filter_files_by_pattern(all_files, ["test_file*"])
+        self.assertEqual(len(filtered), 8)  # Root dir files only
         for file in filtered:
-            self.assertIn("test_file", file)
+            self.assertTrue(os.path.basename(file).startswith("test_file"))
         
-        # Test with regex pattern
-        filtered_regex = filter_files_by_pattern(all_files, r"^test_file_\d+\.jpg$", use_regex=True)
-        self.assertEqual(len(filtered_regex), 2)  # Should match the two jpg files in root dir
+        # Test with several patterns; a file matching both is listed once
+        filtered_multi = filter_files_by_pattern(
+            all_files, ["test_file_?.jpg", "*.jpg"]
+        )
+        self.assertEqual(len(filtered_multi), 4)  # Root and subdir1 jpg files
     
     def test_move_files_with_progress(self):
         """Test moving files with progress tracking."""
         # Create source and destination directories
-        source_dir = self.test_dir / "source"
-        dest_dir = self.test_dir / "destination"
+        scratch_dir = self._make_scratch_dir()
+        source_dir = scratch_dir / "source"
+        dest_dir = scratch_dir / "destination"
         source_dir.mkdir(exist_ok=True)
         ensure_directory_exists(dest_dir)
         
@@ -398,18 +477,24 @@ class TestFileUtils(unittest.TestCase):
         results = move_files_with_progress(files_to_move, str(dest_dir))
         
         # Check results
-        self.assertEqual(len(results), len(files_to_move))
-        for original, moved in results.items():
-            self.assertTrue(moved)
-            self.assertFalse(Path(original).exists())
-            self.assertTrue(Path(dest_dir / Path(original).name).exists())
+        self.assertEqual(results['failed'], [])
+        self.assertEqual(len(results['success']), len(files_to_move))
+        for original, moved in results['success']:
+            self.assertEqual(moved, os.path.join(dest_dir, Path(original).name))
+
+        with os.scandir(source_dir) as entries:
+            self.assertEqual(list(entries), [])
+        with os.scandir(dest_dir) as entries:
+            present = {entry.name for entry in entries}
+        self.assertEqual(present, {Path(original).name for original in files_to_move})
     
     def test_remove_files_with_progress(self):
         """Test removing files with progress tracking."""
         # Create test files to remove
+        scratch_dir = self._make_scratch_dir()
         files_to_remove = []
         for i in range(3):
-            file_path = self.test_dir / f"remove_test_{i}.txt"
+            file_path = scratch_dir / f"remove_test_{i}.txt"
             file_path.touch()
             files_to_remove.append(str(file_path))
         
@@ -422,6 +507,32 @@ class TestFileUtils(unittest.TestCase):
             self.assertTrue(removed)
             self.assertFalse(Path(file_path).exists())
 
+    def test_remove_files_with_progress_batched(self):
+        """Test removing a large batch of files across worker threads."""
+        scratch_dir = self._make_scratch_dir()
+        files_to_remove = [
+            str(scratch_dir / f"remove_test_{i}.txt") for i in range(200)
+        ]
+        _bulk_touch(files_to_remove)
+        missing_file = str(scratch_dir / "missing.txt")
+        progress = []
+
+        with mock.patch(
+            "gneiss.utils.file_utils.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor:
+            results = remove_files_with_progress(
+                files_to_remove + [missing_file],
+                on_progress=lambda current, total: progress.append(current),
+            )
+
+        executor.assert_called_once()
+        self.assertEqual(list(results), files_to_remove + [missing_file])
+        self.assertTrue(all(results[file_path] for file_path in files_to_remove))
+        self.assertFalse(results[missing_file])
+        self.assertEqual(progress, list(range(1, len(files_to_remove) + 2)))
+        with os.scandir(scratch_dir) as entries:
+            self.assertEqual(list(entries), [])
+
 
 if __name__ == "__main__":
     unittest.main()
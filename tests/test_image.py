@@ -2,7 +2,9 @@
 Unit tests for the Image class.
 """
 
+import io
 import os
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -14,24 +16,23 @@ from gneiss import Image
 class TestImage(unittest.TestCase):
     """Test cases for the Image class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test image shared by all tests."""
         # Create a test directory
-        self.test_dir = Path("tests/test_output")
-        self.test_dir.mkdir(parents=True, exist_ok=True)
+        cls._tmp = tempfile.TemporaryDirectory(prefix="gneiss_test_")
+        cls.test_dir = Path(cls._tmp.name)
 
-        # Create a simple test image
-        self.test_image_path = self.test_dir / "test_image.png"
-        self._create_test_image(self.test_image_path)
+        # Create a simple test image, decoded once and copied per test
+        cls.test_image_path = cls.test_dir / "test_image.png"
+        cls._pil_img = PILImage.new("RGB", (100, 100), (255, 0, 0))
+        cls._pil_img.save(cls.test_image_path)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Tear down test fixtures."""
         # Clean up test files
-        for file in self.test_dir.glob("*"):
-            try:
-                file.unlink()
-            except Exception:
-                pass
+        cls._tmp.cleanup()
 
     def _create_test_image(self, path, width=100, height=100, color=(255, 0, 0)):
         """Create a simple test image."""
@@ -59,7 +60,7 @@ class TestImage(unittest.TestCase):
 
     def test_resize(self):
         """Test resizing an image."""
-        img = Image(self.test_image_path)
+        img = Image(self._pil_img.copy())
 
         # Test resize with width only
         resized1 = img.resize(width=50)
@@ -79,25 +80,39 @@ class TestImage(unittest.TestCase):
 
     def test_save(self):
         """Test saving an image."""
-        img = Image(self.test_image_path)
+        img = Image(self._pil_img.copy()).to_format("PNG")
 
         # Save with the same format
-        output_path = self.test_dir / "saved_image.png"
-        img.save(output_path)
-        self.assertTrue(output_path.exists())
+        buf = io.BytesIO()
+        img.save(buf)
+        buf.seek(0)
+        with PILImage.open(buf) as pil_img:
+            self.assertEqual(pil_img.format, "PNG")
 
         # Save with a different format
-        output_path2 = self.test_dir / "saved_image.jpg"
-        img.to_format("JPEG").save(output_path2)
-        self.assertTrue(output_path2.exists())
+        buf2 = io.BytesIO()
+        img.to_format("JPEG").save(buf2)
+        buf2.seek(0)
 
         # Check that the format was changed
-        with PILImage.open(output_path2) as pil_img:
+        with PILImage.open(buf2) as pil_img:
+            self.assertEqual(pil_img.format, "JPEG")
+
+    def test_save_to_disk(self):
+        """Test saving an image to a file path."""
+        img = Image(self._pil_img.copy())
+
+        output_path = self.test_dir / "nested" / "saved_image.jpg"
+        img.to_format("JPEG").save(output_path)
+        self.assertTrue(output_path.exists())
+        self.assertEqual(img.path, str(output_path))
+
+        with PILImage.open(output_path) as pil_img:
             self.assertEqual(pil_img.format, "JPEG")
 
     def test_add_text_watermark(self):
         """Test adding a text watermark."""
-        img = Image(self.test_image_path)
+        img = Image(self._pil_img.copy())
 
         # Add a text watermark
         watermarked = img.add_text_watermark(
@@ -115,7 +130,7 @@ class TestImage(unittest.TestCase):
 
     def test_chained_operations(self):
         """Test chaining multiple operations."""
-        img = Image(self.test_image_path)
+        img = Image(self._pil_img.copy())
 
         # Chain multiple operations
         processed = (
@@ -126,18 +141,18 @@ class TestImage(unittest.TestCase):
         )
 
         # Save the processed image
-        output_path = self.test_dir / "chained_operations.jpg"
-        processed.save(output_path)
-        self.assertTrue(output_path.exists())
+        buf = io.BytesIO()
+        processed.save(buf)
+        buf.seek(0)
 
         # Check that the format was changed
-        with PILImage.open(output_path) as pil_img:
+        with PILImage.open(buf) as pil_img:
             self.assertEqual(pil_img.format, "JPEG")
             self.assertEqual(pil_img.size, (50, 50))
 
     def test_add_watermark(self):
         """Test adding an image watermark."""
-        img = Image(self.test_image_path)
+        img = Image(self._pil_img.copy())
         
         # Create a simple watermark image
         watermark_path = self.test_dir / "watermark.png"
@@ -158,7 +173,7 @@ class TestImage(unittest.TestCase):
 
     def test_strip_metadata(self):
         """Test stripping metadata from an image."""
-        img = Image(self.test_image_path)
+        img = Image(self._pil_img.copy())
         
         # Add dummy metadata (simulate real metadata)
         img.metadata = {"dummy_key": "dummy_value"}